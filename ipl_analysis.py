@@ -12,13 +12,30 @@ print("Phase 1: Loading Data and Initial Setup...")
 print("------------------------------------")
 import pandas as pd
 import numpy as np
+import pyarrow.parquet as pq
+import matplotlib
+matplotlib.use('Agg') # Non-interactive backend: figures are written to PNG files, not shown
 import matplotlib.pyplot as plt
+from matplotlib.ticker import MaxNLocator
 import seaborn as sns
 import warnings
 import os  # Essential for robust path handling
-
-# Ignore warnings for cleaner output (optional)
-warnings.filterwarnings('ignore')
+import glob
+import hashlib
+import re
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+# --- Command-Line Options ---
+parser = argparse.ArgumentParser(description="Exploratory data analysis of the IPL datasets.")
+parser.add_argument('--no-plot', action='store_true',
+                    help="Compute and print the statistics only; skip all figure generation.")
+parser.add_argument('--verbose', action='store_true',
+                    help="Print the full Phase 2 data exploration (info, head, describe, missing values).")
+# parse_known_args tolerates extra arguments injected by interactive environments (e.g. Jupyter)
+args, _ = parser.parse_known_args()
+plots_enabled = not args.no_plot
 
 # Set plotting style
 sns.set_style('darkgrid')
@@ -45,11 +62,82 @@ matches_path = os.path.join(script_dir, 'matches.csv')
 print(f"Attempting to load deliveries from: {deliveries_path}")
 print(f"Attempting to load matches from: {matches_path}")
 
+# Columns the analysis actually uses. Only these are parsed from the CSVs; the
+# rest (non_striker, fielder, umpires, the individual extras, ...) are skipped.
+deliveries_usecols = ['match_id', 'over', 'batsman', 'bowler', 'batsman_runs', 'total_runs', 'dismissal_kind']
+matches_usecols = ['id', 'season', 'date', 'toss_winner', 'toss_decision', 'winner', 'player_of_match', 'venue']
+
+# Explicit column types for the loaded numeric/date columns. Declaring these up
+# front lets the multithreaded PyArrow parser skip type inference on them.
+# The per-ball counts in deliveries.csv are small non-negative numbers, so
+# they fit in uint8 (1 byte/row instead of 8 for the default int64).
+deliveries_dtypes = {
+    'match_id': 'int32',
+    'over': 'uint8',
+    'batsman_runs': 'uint8',
+    'total_runs': 'uint8',
+}
+matches_dtypes = {
+    'id': 'int32',
+    'season': 'int16',
+    'date': 'string', # Parsed to datetime during preprocessing
+}
+# High-repetition string columns, converted to 'category' right after loading.
+# Groupby/value_counts on these then work on small integer codes instead of strings.
+deliveries_category_cols = ['batsman', 'bowler', 'dismissal_kind']
+matches_category_cols = ['venue', 'toss_decision', 'player_of_match']
+# Team columns share a single set of categories so they can be compared with each other
+matches_team_cols = ['toss_winner', 'winner']
+
+# Parquet cache of the typed, preprocessed data (written on the first run).
+# The file names carry a key derived from the loader settings above, so changing any
+# of them makes an existing cache stale instead of silently reusing it.
+cache_version = 2 # Bump when the preprocessing steps change what gets cached
+cache_key = hashlib.sha1(repr((
+    cache_version, deliveries_usecols, matches_usecols, deliveries_dtypes, matches_dtypes,
+    deliveries_category_cols, matches_category_cols, matches_team_cols,
+)).encode()).hexdigest()[:10]
+deliveries_cache_path = os.path.join(script_dir, f'deliveries.{cache_key}.parquet')
+matches_cache_path = os.path.join(script_dir, f'matches.{cache_key}.parquet')
+# Columns each cache must contain ('id' is stored as 'match_id' after preprocessing)
+deliveries_cache_cols = deliveries_usecols
+matches_cache_cols = ['match_id' if col == 'id' else col for col in matches_usecols]
+
 # Load the datasets using the constructed paths
 try:
-    deliveries_df = pd.read_csv(deliveries_path)
-    matches_df = pd.read_csv(matches_path)
-    print("\nDatasets loaded successfully.")
+    # The cache is only used if it matches the current loader settings (see cache_key)
+    # and is newer than both CSVs, so edited CSVs are always re-read. Its column list is
+    # also checked (schema only, no data read) so a cache missing a column is never used.
+    # Any error while checking or reading the cache (e.g. a damaged file) counts as a
+    # cache miss: the CSVs are loaded instead and the cache is rewritten.
+    loaded_from_cache = False
+    try:
+        if all(
+            os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(csv_path)
+            and set(cache_cols).issubset(pq.read_schema(cache_path).names)
+            for cache_path, csv_path, cache_cols in [(deliveries_cache_path, deliveries_path, deliveries_cache_cols),
+                                                     (matches_cache_path, matches_path, matches_cache_cols)]
+        ):
+            # Project to the current column lists, like usecols does for the CSVs
+            deliveries_df = pd.read_parquet(deliveries_cache_path, engine='pyarrow', columns=deliveries_cache_cols)
+            matches_df = pd.read_parquet(matches_cache_path, engine='pyarrow', columns=matches_cache_cols)
+            loaded_from_cache = True
+            print("\nDatasets loaded successfully from the Parquet cache.")
+    except Exception as e:
+        print(f"\nWarning: Could not read the Parquet cache, loading the CSV files instead: {e}")
+    if not loaded_from_cache:
+        deliveries_df = pd.read_csv(deliveries_path, engine='pyarrow', dtype_backend='pyarrow',
+                                    usecols=deliveries_usecols, dtype=deliveries_dtypes)
+        matches_df = pd.read_csv(matches_path, engine='pyarrow', dtype_backend='pyarrow',
+                                 usecols=matches_usecols, dtype=matches_dtypes)
+        for col in deliveries_category_cols:
+            deliveries_df[col] = deliveries_df[col].astype('category')
+        for col in matches_category_cols:
+            matches_df[col] = matches_df[col].astype('category')
+        team_dtype = pd.CategoricalDtype(sorted(pd.unique(matches_df[matches_team_cols].stack().dropna())))
+        for col in matches_team_cols:
+            matches_df[col] = matches_df[col].astype(team_dtype)
+        print("\nDatasets loaded successfully.")
 except FileNotFoundError:
     print(f"\n--- ERROR ---")
     print(f"Could not find 'deliveries.csv' or 'matches.csv' at the expected paths.")
@@ -67,36 +155,45 @@ print("\n------------------------------------")
 print("Phase 2: Data Exploration and Preprocessing...")
 print("------------------------------------")
 
-# Display basic information
-print("\n--- Deliveries Data Info ---")
-deliveries_df.info(memory_usage='deep') # Show memory usage too
-print("\n--- Matches Data Info ---")
-matches_df.info(memory_usage='deep')
-
-# Display first few rows
-print("\n--- Deliveries Data Head (First 5 Rows) ---")
-print(deliveries_df.head())
-print("\n--- Matches Data Head (First 5 Rows) ---")
-print(matches_df.head())
-
-# Display summary statistics for numerical columns
-print("\n--- Deliveries Data Description (Numerical) ---")
-print(deliveries_df.describe())
-print("\n--- Matches Data Description (Numerical) ---")
-print(matches_df.describe())
-
-# Display summary statistics for object columns (like team names, cities)
-print("\n--- Matches Data Description (Categorical) ---")
-print(matches_df.describe(include=['object']))
-
-
-# Check for Missing Values
-print("\n--- Missing Values Count in Deliveries Data ---")
-print(deliveries_df.isnull().sum())
-print("\n--- Missing Values Count in Matches Data ---")
-print(matches_df.isnull().sum())
-# Note: Missing values in 'player_dismissed', 'dismissal_kind', 'fielder' are expected.
-# 'umpire3' often has many missing values. 'city', 'winner' might have a few - investigate if critical.
+# The full exploration output below is only printed with --verbose. Deep memory usage
+# and the categorical describe() walk every string value, which is slow on deliveries_df.
+if args.verbose:
+    # Display basic information
+    print("\n--- Deliveries Data Info ---")
+    deliveries_df.info(memory_usage='deep') # Show memory usage too
+    print("\n--- Matches Data Info ---")
+    matches_df.info(memory_usage='deep')
+
+    # Display first few rows
+    print("\n--- Deliveries Data Head (First 5 Rows) ---")
+    print(deliveries_df.head())
+    print("\n--- Matches Data Head (First 5 Rows) ---")
+    print(matches_df.head())
+
+    # Display summary statistics for numerical columns
+    print("\n--- Deliveries Data Description (Numerical) ---")
+    print(deliveries_df.describe())
+    print("\n--- Matches Data Description (Numerical) ---")
+    print(matches_df.describe())
+
+    # Display summary statistics for object columns (like team names, cities)
+    print("\n--- Matches Data Description (Categorical) ---")
+    print(matches_df.describe(include=['object', 'string', 'category']))
+
+
+    # Check for Missing Values
+    print("\n--- Missing Values Count in Deliveries Data ---")
+    print(deliveries_df.isnull().sum())
+    print("\n--- Missing Values Count in Matches Data ---")
+    print(matches_df.isnull().sum())
+    # Note: Missing values in 'player_dismissed', 'dismissal_kind', 'fielder' are expected.
+    # 'umpire3' often has many missing values. 'city', 'winner' might have a few - investigate if critical.
+else:
+    # Shallow memory summary: just dtype sizes times row counts
+    print("\n--- Data Summary (run with --verbose for full exploration output) ---")
+    for name, df in [('Deliveries', deliveries_df), ('Matches', matches_df)]:
+        print(f"{name}: {df.shape[0]} rows x {df.shape[1]} columns, "
+              f"{df.memory_usage(deep=False).sum() / 1024**2:.1f} MB (shallow)")
 
 # --- Preprocessing Steps ---
 print("\n--- Performing Preprocessing Steps ---")
@@ -107,16 +204,47 @@ if 'id' in matches_df.columns and 'match_id' not in matches_df.columns:
 
 # Convert 'date' column to datetime objects
 try:
-    matches_df['date'] = pd.to_datetime(matches_df['date'])
+    # matches.csv mixes ISO dates (2017-04-05) with day-first short dates (07/04/18).
+    # Each known format is parsed on the fast vectorized path and the results combined.
+    raw_dates = matches_df['date']
+    iso_dates = pd.to_datetime(raw_dates, format='%Y-%m-%d', cache=True, errors='coerce')
+    short_dates = pd.to_datetime(raw_dates, format='%d/%m/%y', cache=True, errors='coerce')
+    matches_df['date'] = iso_dates.fillna(short_dates)
     print("Converted 'date' column to datetime objects.")
-    # Extract season consistently from date, handling potential format issues
-    matches_df['season'] = matches_df['date'].dt.year
+    # Dates in any other format end up as NaT; report them rather than dropping them silently
+    unparsed_dates = (matches_df['date'].isna() & raw_dates.notna()).sum()
+    if unparsed_dates:
+        print(f"Warning: {unparsed_dates} date(s) in an unrecognized format could not be parsed (kept as NaT).")
+    # Extract season consistently from date, handling potential format issues:
+    # rows without a parsed date keep the season given in the CSV
+    matches_df['season'] = matches_df['date'].dt.year.fillna(matches_df['season']).astype(matches_df['season'].dtype)
     print("Extracted/Updated 'season' column from 'date'.")
 except KeyError:
     print("Warning: 'date' column not found in matches_df during conversion.")
 except Exception as e:
     print(f"Warning: Could not convert 'date' column or extract season: {e}")
 
+# Cache the typed, preprocessed DataFrames as Parquet so later runs skip CSV parsing
+if not loaded_from_cache:
+    try:
+        # Remove caches written with other loader settings (including the old unkeyed names).
+        # Only this script's own cache names are matched; other Parquet files are left alone.
+        for name in ('deliveries', 'matches'):
+            for stale_path in glob.glob(os.path.join(script_dir, f'{name}.*')):
+                if re.fullmatch(rf'{name}(\.[0-9a-f]{{10}})?\.parquet', os.path.basename(stale_path)):
+                    os.remove(stale_path)
+        # Each file is written to a temporary name and then renamed into place, so an
+        # interrupted run never leaves a truncated file under the final cache name
+        for df, cache_path in [(deliveries_df, deliveries_cache_path), (matches_df, matches_cache_path)]:
+            df.to_parquet(cache_path + '.tmp', engine='pyarrow', compression='zstd')
+            os.replace(cache_path + '.tmp', cache_path)
+        print("Saved preprocessed data to the Parquet cache for faster loading next time.")
+    except Exception as e:
+        print(f"Warning: Could not write the Parquet cache: {e}")
+        for cache_path in (deliveries_cache_path, matches_cache_path):
+            if os.path.exists(cache_path + '.tmp'):
+                os.remove(cache_path + '.tmp')
+
 # Optional: Merge DataFrames (can be memory intensive!)
 # Consider merging only if subsequent analyses absolutely require it and memory allows.
 # print("\nAttempting to merge dataframes...")
@@ -132,57 +260,204 @@ print("------------------------------------------------")
 
 # Set default figure size for plots
 plt.rcParams['figure.figsize'] = (12, 6) # Width, Height in inches
+# Keep tick/line rendering cheap: major grid only, no minor ticks, simplified paths
+plt.rcParams.update({
+    'axes.grid.which': 'major',
+    'xtick.minor.visible': False,
+    'ytick.minor.visible': False,
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000,
+})
+if plots_enabled:
+    # All figures are saved as PNG files in an 'outputs' folder next to the script
+    output_dir = os.path.join(script_dir, 'outputs')
+    os.makedirs(output_dir, exist_ok=True)
+    print(f"Plots will be saved to: {output_dir}")
+else:
+    print("Plotting disabled (--no-plot): only statistics will be computed.")
+
+def save_plot(name):
+    """Save the current figure as outputs/plot_<name>.png and close it to free its memory."""
+    plt.savefig(os.path.join(output_dir, f'plot_{name}.png'), dpi=90, bbox_inches='tight')
+    plt.close()
+
+# --- Plotting Functions ---
+# Each figure is drawn by its own function from small, already aggregated data,
+# so the figures are independent of each other and can be rendered in parallel.
+def plot_matches_per_season(matches_per_season):
+    plt.figure(figsize=(12, 7)) # Slightly larger figure
+    plt.bar(matches_per_season.index.astype(str), matches_per_season.values,
+            color=sns.color_palette('viridis', len(matches_per_season)))
+    plt.title('Number of Matches Played Per Season', fontsize=16)
+    plt.ylabel('Number of Matches', fontsize=12)
+    plt.xlabel('Season', fontsize=12)
+    plt.xticks(rotation=45, ha='right')
+    plt.tight_layout() # Adjust layout to prevent overlap
+    save_plot('matches_per_season')
+
+def plot_top_venues(top_venues):
+    plt.figure(figsize=(10, 8)) # Taller figure for vertical bars
+    # Seaborn warns (FutureWarning) about 'palette' without 'hue'; silence only that here
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', FutureWarning)
+        sns.barplot(y=top_venues.index.astype(str), x=top_venues.values, palette='magma', orient='h')
+    plt.title('Top 10 Most Frequent Venues', fontsize=16)
+    plt.xlabel('Number of Matches', fontsize=12)
+    plt.ylabel('Venue', fontsize=12)
+    plt.tight_layout()
+    save_plot('top_venues')
+
+def plot_top_winners(top_winners):
+    plt.figure(figsize=(10, 8))
+    with warnings.catch_warnings(): # Same seaborn palette FutureWarning as above
+        warnings.simplefilter('ignore', FutureWarning)
+        sns.barplot(y=top_winners.index.astype(str), x=top_winners.values, palette='plasma', orient='h')
+    plt.title('Top 10 Teams with Most Wins', fontsize=16)
+    plt.xlabel('Number of Wins', fontsize=12)
+    plt.ylabel('Team', fontsize=12)
+    plt.tight_layout()
+    save_plot('top_winners')
+
+def plot_toss_decision(toss_outcome_counts):
+    toss_outcome_counts.plot(kind='bar', figsize=(8, 6), color=sns.color_palette('coolwarm', 2), rot=0)
+    plt.title('Toss Decision vs Match Outcome', fontsize=16)
+    plt.xlabel('Toss Decision', fontsize=12)
+    plt.ylabel('Number of Matches', fontsize=12)
+    # Ensure legend labels are clear
+    handles, _ = plt.gca().get_legend_handles_labels()
+    plt.legend(handles, ['Toss Winner Lost', 'Toss Winner Won'], title='Match Outcome', title_fontsize='13', fontsize='11')
+    plt.tight_layout()
+    save_plot('toss_decision')
+
+def plot_top_batsmen(top_batsmen):
+    plt.figure(figsize=(12, 8)) # Wider figure
+    top_batsmen.plot(kind='bar', color=sns.color_palette('YlGnBu', 15))
+    plt.title('Top 15 Run Scorers in IPL History', fontsize=16)
+    plt.xlabel('Batsman', fontsize=12)
+    plt.ylabel('Total Runs Scored', fontsize=12)
+    plt.xticks(rotation=45, ha='right') # Rotate labels for better readability
+    plt.tight_layout()
+    save_plot('top_batsmen')
+
+def plot_player_of_match(pom_top):
+    plt.figure(figsize=(10, 8)) # Taller figure for horizontal bars
+    # Horizontal bars, most awards at the top (reversed because barh draws bottom-up)
+    plt.barh(pom_top.index.astype(str)[::-1], pom_top.values[::-1], color=sns.color_palette('tab20c', 15)[::-1])
+    plt.title('Top 15 Player of the Match Winners', fontsize=16)
+    plt.xlabel('Number of Player of the Match Awards', fontsize=12)
+    plt.ylabel('Player', fontsize=12)
+    plt.tight_layout()
+    save_plot('player_of_match')
+
+def plot_top_bowlers(top_bowlers):
+    plt.figure(figsize=(12, 8)) # Wider figure
+    top_bowlers.plot(kind='bar', color=sns.color_palette('OrRd_r', 15)) # Reversed palette
+    plt.title('Top 15 Wicket Takers in IPL History', fontsize=16)
+    plt.xlabel('Bowler', fontsize=12)
+    plt.ylabel('Total Wickets Taken', fontsize=12)
+    plt.xticks(rotation=45, ha='right')
+    plt.tight_layout()
+    save_plot('top_bowlers')
+
+def plot_avg_runs_per_over(avg_runs_per_over):
+    plt.figure(figsize=(12, 7))
+    avg_runs_per_over.plot(kind='line', marker='o', color='cyan', linewidth=2, markersize=8)
+    plt.title('Estimated Average Runs Scored per Over (Across all matches)', fontsize=16)
+    plt.xlabel('Over Number', fontsize=12)
+    plt.ylabel('Average Runs per Over (Estimated)', fontsize=12)
+    plt.gca().xaxis.set_major_locator(MaxNLocator(integer=True)) # Over numbers are shown as integers
+    plt.grid(True, which='major', linestyle='--', linewidth=0.7)
+    plt.ylim(bottom=max(0, avg_runs_per_over.min() - 1)) # Start y-axis near minimum value but not below 0
+    plt.tight_layout()
+    save_plot('avg_runs_per_over')
+
+def plot_balls_per_over(balls_per_over):
+    plt.figure(figsize=(12, 7))
+    balls_per_over.plot(kind='bar', color='skyblue', edgecolor='black')
+    plt.title('Distribution of Balls Bowled Per Over Number', fontsize=16)
+    plt.xlabel('Over Number', fontsize=12)
+    plt.ylabel('Number of Balls Bowled', fontsize=12)
+    plt.xticks(rotation=0)
+    plt.grid(axis='y', linestyle='--', linewidth=0.7)
+    plt.tight_layout()
+    save_plot('balls_per_over')
+
+def plot_avg_score_per_season(avg_score_per_season, sorted_seasons):
+    plt.figure(figsize=(12, 7))
+    avg_score_per_season.plot(kind='line', marker='o', color='green', linewidth=2, markersize=8)
+    plt.title('Average Total Runs per Match Across Seasons', fontsize=16)
+    plt.xlabel('Season', fontsize=12)
+    plt.ylabel('Average Total Runs Scored per Match', fontsize=12)
+    plt.xticks(sorted_seasons) # Ensure all seasons are marked
+    plt.grid(True, which='both', linestyle='--', linewidth=0.7)
+    plt.tight_layout()
+    save_plot('avg_score_per_season')
+
+def run_plot_job(plot_fn, plot_args):
+    """Run one plot function with its arguments, in this process or in a worker process."""
+    plot_fn(*plot_args)
+
+# Plots are queued here as (title, function, arguments) while the analysis runs and rendered at the end
+plot_jobs = []
+
+# --- Deliveries Aggregations ---
+# All reductions over the large deliveries_df are computed together here, once,
+# before any plotting. The plots below only consume these small results.
+print("\n--- Computing Aggregations over Deliveries Data ---")
+# Total runs per batsman (used for the top run scorers plot). Groupbys use observed=True
+# so categorical keys only produce groups for values that actually occur.
+top_batsmen = deliveries_df.groupby('batsman', observed=True)['batsman_runs'].sum().nlargest(15)
+# Wickets credited to the bowler (run outs, retired hurt, etc. are excluded)
+dismissal_types_for_bowler = ['caught', 'bowled', 'lbw', 'stumped', 'caught and bowled', 'hit wicket']
+# Boolean mask over deliveries_df; only the 'bowler' column is selected with it (no filtered frame copy)
+wickets_mask = deliveries_df['dismissal_kind'].isin(dismissal_types_for_bowler)
+top_bowlers = deliveries_df.loc[wickets_mask, 'bowler'].value_counts(sort=False).nlargest(15)
+# Per-over statistics: the number of deliveries bowled in each over and the runs scored in it.
+# 'over' is a small dense integer (1-20), so np.bincount acts as a direct scatter-add
+# over the raw arrays, with no hashing of group keys.
+over_numbers = deliveries_df['over'].to_numpy()
+balls_by_over = np.bincount(over_numbers)
+runs_by_over = np.bincount(over_numbers, weights=deliveries_df['total_runs'].to_numpy())
+bowled_overs = np.flatnonzero(balls_by_over) # Over numbers that actually occur
+over_index = pd.Index(bowled_overs, name='over')
+balls_per_over = pd.Series(balls_by_over[bowled_overs], index=over_index)
+# Simple estimation: mean runs per ball in that over * 6
+avg_runs_per_over = pd.Series(runs_by_over[bowled_overs] / balls_by_over[bowled_overs] * 6, index=over_index)
+# Total runs per match_id, kept indexed by match_id for the season trend join.
+# sort=False skips sorting the group keys; the join aligns on the index anyway.
+total_runs_per_match = deliveries_df.groupby('match_id', sort=False, observed=True)['total_runs'].sum()
+print("Aggregations computed.")
 
 # --- Basic Match Statistics (from matches_df) ---
 print("\n--- Analyzing Basic Match Statistics ---")
+# Per-match arrays shared by several analyses below, extracted once
+sorted_seasons = np.unique(matches_df['season'].to_numpy()) # Sorted unique seasons (plot order and ticks)
+# Both team columns share the same categories, so their integer codes can be compared directly
+toss_winner_codes = matches_df['toss_winner'].cat.codes.to_numpy()
+winner_codes = matches_df['winner'].cat.codes.to_numpy()
 
 # 1. Number of matches per season
-print("Plotting: Number of Matches Per Season...")
-plt.figure(figsize=(12, 7)) # Slightly larger figure
-sns.countplot(x='season', data=matches_df, palette='viridis', order = sorted(matches_df['season'].unique())) # Ensure seasons are ordered
-plt.title('Number of Matches Played Per Season', fontsize=16)
-plt.ylabel('Number of Matches', fontsize=12)
-plt.xlabel('Season', fontsize=12)
-plt.xticks(rotation=45, ha='right')
-plt.tight_layout() # Adjust layout to prevent overlap
-plt.show()
+# Counted once here and drawn with plain plt.bar (cheaper than sns.countplot re-counting the frame)
+matches_per_season = matches_df['season'].value_counts().reindex(sorted_seasons) # Ensure seasons are ordered
+plot_jobs.append(('Number of Matches Per Season', plot_matches_per_season, (matches_per_season,)))
 
 # 2. Most frequent venues (Top 10)
-print("Plotting: Top 10 Most Frequent Venues...")
-plt.figure(figsize=(10, 8)) # Taller figure for vertical bars
-top_venues = matches_df['venue'].value_counts().head(10)
-sns.barplot(y=top_venues.index, x=top_venues.values, palette='magma', orient='h')
-plt.title('Top 10 Most Frequent Venues', fontsize=16)
-plt.xlabel('Number of Matches', fontsize=12)
-plt.ylabel('Venue', fontsize=12)
-plt.tight_layout()
-plt.show()
+# Only the top 10 are needed, so take them with nlargest (partial sort) instead of sorting every count
+top_venues = matches_df['venue'].value_counts(sort=False).nlargest(10)
+plot_jobs.append(('Top 10 Most Frequent Venues', plot_top_venues, (top_venues,)))
 
 # 3. Teams with most wins (Top 10)
-print("Plotting: Top 10 Teams with Most Wins...")
 # Handle cases where winner might be NaN (e.g., tied/no result matches)
-plt.figure(figsize=(10, 8))
-top_winners = matches_df['winner'].value_counts().dropna().head(10) # Drop NaN winners before counting
-sns.barplot(y=top_winners.index, x=top_winners.values, palette='plasma', orient='h')
-plt.title('Top 10 Teams with Most Wins', fontsize=16)
-plt.xlabel('Number of Wins', fontsize=12)
-plt.ylabel('Team', fontsize=12)
-plt.tight_layout()
-plt.show()
+top_winners = matches_df['winner'].value_counts(sort=False).nlargest(10) # value_counts skips NaN winners
+plot_jobs.append(('Top 10 Teams with Most Wins', plot_top_winners, (top_winners,)))
 
 # 4. Toss Decision Impact
-print("Analyzing and Plotting: Toss Decision Impact...")
-toss_wins = matches_df['toss_winner'] == matches_df['winner']
-plt.figure(figsize=(8, 6))
-sns.countplot(x='toss_decision', data=matches_df, hue=toss_wins, palette='coolwarm')
-plt.title('Toss Decision vs Match Outcome', fontsize=16)
-plt.xlabel('Toss Decision', fontsize=12)
-plt.ylabel('Number of Matches', fontsize=12)
-# Ensure legend labels are clear
-handles, _ = plt.gca().get_legend_handles_labels()
-plt.legend(handles, ['Toss Winner Lost', 'Toss Winner Won'], title='Match Outcome', title_fontsize='13', fontsize='11')
-plt.tight_layout()
-plt.show()
+print("Analyzing: Toss Decision Impact...")
+toss_wins = (toss_winner_codes == winner_codes) & (winner_codes != -1) # Code -1 is a missing winner (no result)
+# Matches per toss decision, split by whether the toss winner also won (columns: False, True)
+toss_outcome_counts = pd.crosstab(matches_df['toss_decision'], toss_wins)
+plot_jobs.append(('Toss Decision vs Match Outcome', plot_toss_decision, (toss_outcome_counts,)))
 
 toss_decision_counts = matches_df['toss_decision'].value_counts()
 print(f"\nOverall Toss Decisions:\n{toss_decision_counts}")
@@ -192,114 +467,72 @@ print(f"\nOverall Toss Decisions:\n{toss_decision_counts}")
 print("\n--- Analyzing Player Performance ---")
 
 # 5. Top Run Scorers (Top 15)
-print("Plotting: Top 15 Run Scorers...")
-top_batsmen = deliveries_df.groupby('batsman')['batsman_runs'].sum().sort_values(ascending=False).head(15)
-plt.figure(figsize=(12, 8)) # Wider figure
-top_batsmen.plot(kind='bar', color=sns.color_palette('YlGnBu', 15))
-plt.title('Top 15 Run Scorers in IPL History', fontsize=16)
-plt.xlabel('Batsman', fontsize=12)
-plt.ylabel('Total Runs Scored', fontsize=12)
-plt.xticks(rotation=45, ha='right') # Rotate labels for better readability
-plt.tight_layout()
-plt.show()
+plot_jobs.append(('Top 15 Run Scorers', plot_top_batsmen, (top_batsmen,)))
 
 # 6. Most Player of the Match Awards (Top 15)
-print("Plotting: Top 15 Player of the Match Winners...")
 # Handle potential NaN values in player_of_match
 if matches_df['player_of_match'].isnull().any():
     print(f"Note: Found {matches_df['player_of_match'].isnull().sum()} missing value(s) in 'player_of_match'. Excluding them from PoM analysis.")
-    pom_counts = matches_df['player_of_match'].dropna().value_counts()
+    pom_counts = matches_df['player_of_match'].dropna().value_counts(sort=False)
 else:
-    pom_counts = matches_df['player_of_match'].value_counts()
-
-plt.figure(figsize=(10, 10)) # Make pie chart large enough
-pom_counts.head(15).plot(kind='pie', autopct='%1.1f%%', startangle=140, pctdistance=0.85,
-                         colors=sns.color_palette('tab20c', 15), textprops={'fontsize': 11})
-plt.title('Top 15 Player of the Match Winners', fontsize=16)
-plt.ylabel('') # Hide default ylabel for pie charts
-plt.axis('equal') # Equal aspect ratio ensures that pie is drawn as a circle.
-plt.tight_layout()
-plt.show()
+    pom_counts = matches_df['player_of_match'].value_counts(sort=False)
+plot_jobs.append(('Top 15 Player of the Match Winners', plot_player_of_match, (pom_counts.nlargest(15),)))
 
 # 7. Top Wicket Takers (Top 15)
-print("Plotting: Top 15 Wicket Takers...")
-# Filter out non-bowler related dismissals (run out, retired hurt, etc.)
-dismissal_types_for_bowler = ['caught', 'bowled', 'lbw', 'stumped', 'caught and bowled', 'hit wicket']
-wickets_df = deliveries_df[deliveries_df['dismissal_kind'].isin(dismissal_types_for_bowler)]
-top_bowlers = wickets_df.groupby('bowler')['dismissal_kind'].count().sort_values(ascending=False).head(15)
-
-plt.figure(figsize=(12, 8)) # Wider figure
-top_bowlers.plot(kind='bar', color=sns.color_palette('OrRd_r', 15)) # Reversed palette
-plt.title('Top 15 Wicket Takers in IPL History', fontsize=16)
-plt.xlabel('Bowler', fontsize=12)
-plt.ylabel('Total Wickets Taken', fontsize=12)
-plt.xticks(rotation=45, ha='right')
-plt.tight_layout()
-plt.show()
+plot_jobs.append(('Top 15 Wicket Takers', plot_top_bowlers, (top_bowlers,)))
 
 # --- Innings Analysis (from deliveries_df) ---
 print("\n--- Analyzing Innings Statistics ---")
 
 # 8. Average Runs per Over (Across all matches)
-print("Plotting: Estimated Average Runs per Over...")
-# Simple estimation: mean runs per ball in that over * 6
-avg_runs_per_over = deliveries_df.groupby('over')['total_runs'].mean() * 6
-
-plt.figure(figsize=(12, 7))
-avg_runs_per_over.plot(kind='line', marker='o', color='cyan', linewidth=2, markersize=8)
-plt.title('Estimated Average Runs Scored per Over (Across all matches)', fontsize=16)
-plt.xlabel('Over Number', fontsize=12)
-plt.ylabel('Average Runs per Over (Estimated)', fontsize=12)
-plt.xticks(np.arange(1, avg_runs_per_over.index.max() + 1, 1)) # Ensure all over numbers are shown as integers
-plt.grid(True, which='major', linestyle='--', linewidth=0.7)
-plt.ylim(bottom=max(0, avg_runs_per_over.min() - 1)) # Start y-axis near minimum value but not below 0
-plt.tight_layout()
-plt.show()
+plot_jobs.append(('Estimated Average Runs per Over', plot_avg_runs_per_over, (avg_runs_per_over,)))
 
 # 9. Distribution of Balls Bowled Per Over Number
-print("Plotting: Distribution of Balls Bowled per Over...")
-plt.figure(figsize=(12, 7))
-balls_per_over = deliveries_df['over'].value_counts().sort_index()
-balls_per_over.plot(kind='bar', color='skyblue', edgecolor='black')
-plt.title('Distribution of Balls Bowled Per Over Number', fontsize=16)
-plt.xlabel('Over Number', fontsize=12)
-plt.ylabel('Number of Balls Bowled', fontsize=12)
-plt.xticks(rotation=0)
-plt.grid(axis='y', linestyle='--', linewidth=0.7)
-plt.tight_layout()
-plt.show()
+plot_jobs.append(('Distribution of Balls Bowled per Over', plot_balls_per_over, (balls_per_over,)))
 
 # --- Trend Analysis ---
 print("\n--- Analyzing Trends Over Seasons ---")
 
 # 10. Average Total Runs per Match Across Seasons
-print("Plotting: Average Total Runs per Match Across Seasons...")
-# Requires calculating total runs per match_id from deliveries_df
-# then merging with matches_df to get the season.
-total_runs_per_match = deliveries_df.groupby('match_id')['total_runs'].sum().reset_index()
-# Merge with matches_df containing 'season' and 'match_id'
-# Make sure 'season' column exists and is clean before merge
+print("Analyzing: Average Total Runs per Match Across Seasons...")
+# Uses total runs per match_id (computed above from deliveries_df),
+# joined with matches_df to get the season.
+# Join on the match_id index with the 'season' column of matches_df
+# Make sure 'season' column exists and is clean before the join
 if 'season' in matches_df.columns:
-    match_runs_season = pd.merge(total_runs_per_match, matches_df[['match_id', 'season']], on='match_id', how='left')
+    match_runs_season = total_runs_per_match.to_frame().join(matches_df.set_index('match_id')['season'], how='left')
 
     # Check if merge was successful and season exists after merge
     if 'season' in match_runs_season.columns and not match_runs_season['season'].isnull().all():
-        avg_score_per_season = match_runs_season.groupby('season')['total_runs'].mean()
-
-        plt.figure(figsize=(12, 7))
-        avg_score_per_season.plot(kind='line', marker='o', color='green', linewidth=2, markersize=8)
-        plt.title('Average Total Runs per Match Across Seasons', fontsize=16)
-        plt.xlabel('Season', fontsize=12)
-        plt.ylabel('Average Total Runs Scored per Match', fontsize=12)
-        plt.xticks(sorted(avg_score_per_season.index.unique())) # Ensure all seasons are marked
-        plt.grid(True, which='both', linestyle='--', linewidth=0.7)
-        plt.tight_layout()
-        plt.show()
+        avg_score_per_season = match_runs_season.groupby('season', observed=True)['total_runs'].mean()
+        plot_jobs.append(('Average Total Runs per Match Across Seasons', plot_avg_score_per_season, (avg_score_per_season, sorted_seasons)))
     else:
-        print("Could not perform average score per season analysis (missing 'season' column data after merge).")
+        print("Could not perform average score per season analysis (missing 'season' column data after join).")
 else:
      print("Could not perform average score per season analysis ('season' column not found in matches_df).")
 
+# --- Render the Plots ---
+if plots_enabled:
+    # The figures are independent, so they are rendered in parallel worker processes.
+    # Workers are only started with 'fork' (Linux): with 'spawn' (Windows, macOS default)
+    # each worker would re-run this whole top-level script, so the plots run serially there.
+    n_workers = min(len(plot_jobs), os.cpu_count() or 1)
+    if n_workers > 1 and 'fork' in multiprocessing.get_all_start_methods():
+        print(f"\nRendering {len(plot_jobs)} plots in {n_workers} worker processes...")
+        # Progress is printed here in the parent, so worker output cannot interleave with it
+        with ProcessPoolExecutor(max_workers=n_workers, mp_context=multiprocessing.get_context('fork')) as executor:
+            futures = []
+            for title, plot_fn, plot_args in plot_jobs:
+                print(f"Plotting: {title}...")
+                futures.append(executor.submit(run_plot_job, plot_fn, plot_args))
+            for future in futures:
+                future.result() # re-raises any error from a worker
+    else:
+        print(f"\nRendering {len(plot_jobs)} plots...")
+        for title, plot_fn, plot_args in plot_jobs:
+            print(f"Plotting: {title}...")
+            run_plot_job(plot_fn, plot_args)
+    print(f"All figures saved to: {output_dir}")
 
 # ---------------------------------------------------------------------------
 # Phase 4: Conclusion